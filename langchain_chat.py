@@ -1,15 +1,70 @@
 import gradio as gr
-import requests
+import httpx
 import urllib.parse
 from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
 from langchain_ollama import ChatOllama
 from langchain_core.tools import tool
-from langchain_core.messages import HumanMessage, ToolMessage, AIMessage
+from langchain_core.utils.function_calling import convert_to_openai_tool
+from langchain_core.messages import (
+    HumanMessage, ToolMessage, AIMessage, BaseMessage, message_to_dict, messages_from_dict
+)
 import ast
+import asyncio
+import copy
+import diskcache
+import json
+import logging
+import orjson
+import re
+import threading
+import time
 import uuid
+from collections import OrderedDict
+from functools import lru_cache
+from hashlib import blake2b
+from typing import Awaitable, Callable, Iterable
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+# Shared so concurrent searches reuse keep-alive connections instead of a fresh TLS handshake
+_CLIENT = httpx.AsyncClient(
+    transport=httpx.AsyncHTTPTransport(
+        http2=True,
+        retries=2,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=40),
+    ),
+    timeout=httpx.Timeout(10.0, connect=3.0),
+    follow_redirects=True,
+    headers={
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+    },
+)
+
+DDG_SEARCH_URL = "https://html.duckduckgo.com/html/"
+
+# Cap on how much of an article page is downloaded and parsed
+MAX_PAGE_BYTES = 200_000
+
+# Shape of the text handed back to the model: up to MAX_PARAGRAPHS paragraphs longer
+# than MIN_PARAGRAPH_LENGTH, found in the first PARAGRAPH_SCAN_LIMIT <p> tags, capped
+# at MAX_CONTENT_LENGTH characters
+MAX_PARAGRAPHS = 8
+MIN_PARAGRAPH_LENGTH = 50
+PARAGRAPH_SCAN_LIMIT = 64
+MAX_CONTENT_LENGTH = 1500
+MAX_SEARCH_RESULTS = 3
+
+# DuckDuckGo wraps result links as /l/?uddg=<quoted target>&...
+_UDDG_RE = re.compile(r'[?&]uddg=([^&]+)')
 
+# Caps in-flight DuckDuckGo searches so parallel tool calls don't trip its rate limiting
+_SEARCH_SEMAPHORE = asyncio.Semaphore(4)
 
-def extract_tool_calls_and_content(response, debug: bool = False):
+
+def extract_tool_calls_and_content(response):
     """
     Determine what to do with a response:
     1. If it has tool_calls, return them.
@@ -20,27 +75,18 @@ def extract_tool_calls_and_content(response, debug: bool = False):
         content_to_return: string content (only used if calls_to_execute is empty)
     """
     content = getattr(response, "content", "")
-    tool_calls = getattr(response, "tool_calls", [])
-
-    print_debug(f"  Content: {repr(content)}", debug)
+    tool_calls = getattr(response, "tool_calls", None) or ()
 
     if not tool_calls and is_tool_call_like(content):
         converted = convert_to_tool_call(content)
         if converted:
             tool_calls = [converted]
-            print_debug(f"  Converted content to tool_call: {converted}", debug)
 
-    calls_to_execute = tool_calls if tool_calls else []
+    logger.debug("  type=%s tool_calls=%s content=%r", type(response).__name__, tool_calls, content)
 
-    if calls_to_execute:
-        print_debug(f"  Tool calls detected:", debug)
-        for call in calls_to_execute:
-            print_debug(f"    - Tool name: {call.get('name')}", debug)
-            print_debug(f"      Args: {call.get('args')}", debug)
-        return calls_to_execute, None  # content not used if we have tool calls
-    else:
-        print_debug("  No tool calls.", debug)
-        return [], content  # return content if no tool calls
+    if tool_calls:
+        return list(tool_calls), None  # content not used if we have tool calls
+    return [], content  # return content if no tool calls
 
 
 def convert_to_tool_call(raw: dict | str) -> dict:
@@ -48,53 +94,60 @@ def convert_to_tool_call(raw: dict | str) -> dict:
     Convert model-emitted tool dict/string to proper LangChain tool_call format.
     """
     if isinstance(raw, str):
-        try:
-            # Convert Python-like string to dict
-            raw = ast.literal_eval(raw)
-        except Exception as e:
-            return {}
+        raw = _parse_tool_call_text(raw)
 
     if isinstance(raw, dict) and "name" in raw and "parameters" in raw:
         return {
             "id": str(uuid.uuid4()),          # unique id
             "name": raw.get("name", "unknown"),
-            "args": raw.get("parameters", {}),# parameters become args
+            # parameters become args; copied so callers can't mutate the parse cache
+            "args": copy.deepcopy(raw.get("parameters", {})),
             "type": "tool_call"
         }
 
     return {}
 
 
-def is_tool_call_like(text: dict|str) -> bool:
+def _parse_tool_call_text(text: str) -> dict | None:
     """
-    Returns True if `text` is a string that can be converted to a tool call.
-    Safe to call on any string.
+    Parse a tool-call-shaped string into a dict, or None if it isn't one.
     """
     text = text.strip()
+    # Shape check first so ordinary replies never reach (and fill) the parse cache
     if not (text.startswith("{") and text.endswith("}")):
-        return False
+        return None
+    return _parse_tool_call_dict(text)
+
+
+@lru_cache(maxsize=128)
+def _parse_tool_call_dict(text: str) -> dict | None:
+    # Cached so is_tool_call_like and convert_to_tool_call share one parse
     try:
-        data = ast.literal_eval(text)  # safe conversion to Python dict
-        return isinstance(data, dict) and "name" in data and "parameters" in data
-    except Exception as e:
-        return False
+        data = orjson.loads(text)
+    except orjson.JSONDecodeError:
+        try:
+            data = ast.literal_eval(text)  # Python-style dicts (single quotes, True/None)
+        except Exception:
+            return None
+    if isinstance(data, dict) and "name" in data and "parameters" in data:
+        return data
+    return None
 
 
-def print_debug(message: str, debug: bool):
-    if debug:
-        print(message)
+def is_tool_call_like(text: dict|str) -> bool:
+    """
+    Returns True if `text` is a string that can be converted to a tool call.
+    Safe to call on any string.
+    """
+    return isinstance(text, str) and _parse_tool_call_text(text) is not None
 
 
-def normalize_duckduckgo_url(url: str, debug: bool) -> str:
-    if 'uddg=' in url:
-        parsed = urllib.parse.urlparse(
-            url if url.startswith('http') else 'https:' + url
-        )
-        params = urllib.parse.parse_qs(parsed.query)
-        if 'uddg' in params:
-            actual = urllib.parse.unquote(params['uddg'][0])
-            print_debug(f"Extracted actual URL: {actual}", debug)
-            return actual
+def normalize_duckduckgo_url(url: str) -> str:
+    match = _UDDG_RE.search(url)
+    if match:
+        actual = urllib.parse.unquote(match.group(1))
+        logger.debug("Extracted actual URL: %s", actual)
+        return actual
 
     if url.startswith('//'):
         return 'https:' + url
@@ -103,112 +156,373 @@ def normalize_duckduckgo_url(url: str, debug: bool) -> str:
     return url
 
 
-def extract_page_content(html: str, debug: bool) -> str:
-    soup = BeautifulSoup(html, 'html.parser')
+def _first_paragraphs(texts: Iterable[str], limit: int = MAX_PARAGRAPHS,
+                     min_length: int = MIN_PARAGRAPH_LENGTH) -> list[str]:
+    # Pulls from a lazy iterable so each paragraph's text is built once and we stop early
+    paragraphs = []
+    for text in texts:
+        if len(text) > min_length:
+            paragraphs.append(text)
+            if len(paragraphs) == limit:
+                break
+    return paragraphs
+
+
+def _page_paragraphs(html: str, scan_limit: int = PARAGRAPH_SCAN_LIMIT) -> list[str]:
+    try:
+        tree = LexborHTMLParser(html)
+        for node in tree.css("script, style, nav, header, footer"):
+            node.decompose()
+        return _first_paragraphs(
+            node.text(separator=' ', strip=True) for node in tree.css('p')[:scan_limit]
+        )
+    except Exception:
+        # selectolax chokes on the odd malformed page; bs4 is slower but forgiving
+        soup = BeautifulSoup(html, 'lxml')
+        for tag in soup(["script", "style", "nav", "header", "footer"]):
+            tag.decompose()
+        return _first_paragraphs(
+            p.get_text(' ', strip=True) for p in soup.find_all('p', limit=scan_limit)
+        )
+
 
-    for tag in soup(["script", "style", "nav", "header", "footer"]):
-        tag.decompose()
+def extract_page_content(html: str | bytes, encoding: str | None = None) -> str:
+    if isinstance(html, bytes):
+        # Decode with the header encoding so the charset is never sniffed
+        html = html.decode(encoding or 'utf-8', errors='replace')
 
-    paragraphs = [
-        p.get_text().strip()
-        for p in soup.find_all('p')[:8]
-        if len(p.get_text(strip=True)) > 50
-    ]
+    paragraphs = _page_paragraphs(html)
 
-    print_debug(f"Found {len(paragraphs)} paragraphs", debug)
+    logger.debug("Found %d paragraphs", len(paragraphs))
 
     content = ' '.join(paragraphs)
-    if len(content) > 1500:
-        content = content[:1500] + "..."
+    if len(content) > MAX_CONTENT_LENGTH:
+        content = content[:MAX_CONTENT_LENGTH] + "..."
 
-    print_debug(f"Content length: {len(content)}", debug)
+    logger.debug("Content length: %d", len(content))
     return content
 
 
-@tool
-def search_web(query: str, debug: bool = False) -> str:
-    """Search the web for current information."""
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-    }
-
+def parse_search_results(html: str, limit: int = MAX_SEARCH_RESULTS) -> list[tuple[str, str]]:
+    """
+    Return (title, href) pairs for the top results of a DuckDuckGo HTML page.
+    """
     try:
-        search_url = f"https://html.duckduckgo.com/html/?q={query}"
-        response = requests.get(search_url, headers=headers, timeout=10)
-        soup = BeautifulSoup(response.text, 'html.parser')
+        links = LexborHTMLParser(html).css('a.result__a')[:limit]
+        return [(a.text(strip=True), a.attributes.get('href') or '') for a in links]
+    except Exception:
+        soup = BeautifulSoup(html, 'lxml')
+        links = soup.find_all('a', class_='result__a', limit=limit)
+        return [(a.get_text(strip=True), a.get('href') or '') for a in links]
 
-        links = soup.find_all('a', class_='result__a', limit=3)
-        if not links:
-            return "No results found"
 
-        first = links[0]
-        title = first.get_text(strip=True)
-        url = normalize_duckduckgo_url(first.get('href'), debug)
+async def fetch_page(url: str, max_bytes: int = MAX_PAGE_BYTES) -> tuple[bytes, str | None]:
+    """
+    Stream a page and stop after `max_bytes`; the paragraphs we keep are near the top.
+    Returns the raw body and its declared encoding.
+    """
+    body = bytearray()
+    async with _CLIENT.stream("GET", url) as page:
+        logger.debug("Final URL: %s", page.url)
+        logger.debug("Status code: %s (%s)", page.status_code, page.http_version)
+
+        async for chunk in page.aiter_bytes(65536):
+            body.extend(chunk)
+            if len(body) >= max_bytes:
+                break
+
+        return bytes(body), page.encoding
+
+
+async def fetch_search_results(query: str) -> str | None:
+    """
+    Search DuckDuckGo and summarize the top result. Returns None when no results came
+    back, whether DuckDuckGo had none or couldn't be reached, so it is never cached.
+    """
+    results = []
 
-        print_debug(f"Fetching content from: {url}", debug)
+    try:
+        # params= URL-encodes the query so spaces, '&', '#' and unicode survive
+        response = await _CLIENT.get(DDG_SEARCH_URL, params={"q": query})
+
+        results = parse_search_results(response.text)
+        if not results:
+            return None
 
-        page = requests.get(url, headers=headers, timeout=10, allow_redirects=True)
-        print_debug(f"Final URL: {page.url}", debug)
-        print_debug(f"Status code: {page.status_code}", debug)
+        title, href = results[0]
+        url = normalize_duckduckgo_url(href)
 
-        content = extract_page_content(page.text, debug)
+        logger.debug("Fetching content from: %s", url)
+
+        html, encoding = await fetch_page(url)
+        content = extract_page_content(html, encoding=encoding)
         if len(content) > 100:
             return f"Source: {title}\n\n{content}"
 
     except Exception as e:
-        print_debug(f"Search error: {e}", debug)
+        logger.debug("Search error: %s", e)
 
-    titles = [l.get_text(strip=True) for l in links]
+    if not results:
+        return None
+    titles = [title for title, _ in results]
     return "Search results: " + " | ".join(titles)
 
 
+class SearchCache:
+    """
+    LRU cache of search results with a TTL, keyed on the normalized query.
+
+    Semantic matching is opt-in: pass a LangChain embeddings model (for example
+    OllamaEmbeddings(model="nomic-embed-text"), which must be pulled in Ollama first)
+    and misses fall back to the closest cached query by cosine similarity. That costs
+    an embedding round trip on every miss, and loading a second Ollama model can
+    evict the chat model on a memory-limited machine. `similarity_threshold` has to
+    be tuned for the embedding model. Queries that differ only by an entity
+    ("weather in Paris" vs "weather in London") can score above a loose threshold.
+    """
+
+    def __init__(self, embeddings=None, max_entries: int = 512, ttl: float = 3600.0,
+                 similarity_threshold: float = 0.92):
+        self.embeddings = embeddings
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.similarity_threshold = similarity_threshold
+        # normalized query -> (unit embedding or None, result, timestamp)
+        self._entries: OrderedDict[str, tuple[np.ndarray | None, str, float]] = OrderedDict()
+        self._keys: list[str] = []
+        self._matrix: np.ndarray | None = None
+
+    @staticmethod
+    def normalize(query: str) -> str:
+        return " ".join(query.lower().split())
+
+    async def get_or_fetch(self, query: str,
+                           fetch: Callable[[], Awaitable[str | None]]) -> str | None:
+        """
+        Return the cached result for `query`, or await `fetch`. A None from `fetch`
+        means the search failed and is passed through without being cached.
+        """
+        key = self.normalize(query)
+        self._expire()
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            logger.debug("Search cache hit: %r", key)
+            self._entries.move_to_end(key)
+            return entry[1]
+
+        embedding = await self._embed(key)
+        similar = self._most_similar(embedding)
+        if similar is not None:
+            logger.debug("Search cache semantic hit: %r ~ %r", key, similar)
+            self._entries.move_to_end(similar)
+            return self._entries[similar][1]
+
+        result = await fetch()
+        if result is not None:
+            self._store(key, embedding, result)
+        return result
+
+    async def _embed(self, text: str) -> np.ndarray | None:
+        if self.embeddings is None:
+            return None
+        try:
+            vector = np.asarray(await self.embeddings.aembed_query(text), dtype=np.float32)
+        except Exception:
+            # No embedding model available: exact matching still works
+            return None
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else None
+
+    def _most_similar(self, embedding: np.ndarray | None) -> str | None:
+        if embedding is None:
+            return None
+
+        if self._matrix is None:
+            self._keys = [k for k, (vec, _, _) in self._entries.items() if vec is not None]
+            self._matrix = (np.stack([self._entries[k][0] for k in self._keys])
+                            if self._keys else np.empty((0, embedding.shape[0]), dtype=np.float32))
+        if not self._keys or self._matrix.shape[1] != embedding.shape[0]:
+            return None
+
+        # Embeddings are unit length, so one matrix-vector product gives every cosine
+        scores = self._matrix @ embedding
+        best = int(np.argmax(scores))
+        return self._keys[best] if scores[best] >= self.similarity_threshold else None
+
+    def _store(self, key: str, embedding: np.ndarray | None, result: str):
+        self._entries[key] = (embedding, result, time.monotonic())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        self._matrix = None
+
+    def _expire(self):
+        cutoff = time.monotonic() - self.ttl
+        # Insertion order is refreshed on hits, so check every entry rather than stopping early
+        expired = [k for k, (_, _, stamp) in self._entries.items() if stamp < cutoff]
+        for key in expired:
+            del self._entries[key]
+        if expired:
+            self._matrix = None
+
+
+# Exact-match only; see SearchCache before enabling semantic matching
+_SEARCH_CACHE = SearchCache()
+
+
+async def _search_web_impl(query: str) -> str:
+    """Search the web for current information."""
+    async def fetch() -> str | None:
+        async with _SEARCH_SEMAPHORE:
+            return await fetch_search_results(query)
+
+    result = await _SEARCH_CACHE.get_or_fetch(query, fetch)
+    return result if result is not None else "No results found"
+
+
+# The tool is only needed for its schema in bind_tools; run_agent calls the impl
+# directly so dispatch skips LangChain's argument validation and callback setup.
+search_web = tool("search_web")(_search_web_impl)
+
+# OpenAI-format schema, built once at import and shared by every ChatbotUI
+TOOL_SCHEMA = [convert_to_openai_tool(search_web)]
+
+
 class ChatbotUI:
-    def __init__(self, debug: bool = False):
-        self.debug = debug
-        self.llm = ChatOllama(model="llama3.1:8b").bind_tools([search_web])
+    def __init__(self, model: str = "llama3.1:8b", cache_dir: str = ".llm_cache",
+                 cache_ttl: float = 3600.0, keep_alive: str | int = "30m", num_ctx: int = 4096,
+                 num_predict: int | None = None, temperature: float = 0.0, top_p: float = 0.1,
+                 warm_up: bool = True, max_sessions: int = 256):
+        # Greedy-ish decoding keeps tool calls stable, which also raises the response cache hit rate
+        options = dict(num_ctx=num_ctx, num_predict=num_predict, temperature=temperature, top_p=top_p)
+        self.model = model
+        self.keep_alive = keep_alive
+        self.options = options
+        # keep_alive holds the model (and its prompt KV cache) in Ollama between turns
+        self.llm = ChatOllama(model=model, keep_alive=keep_alive, **options).bind_tools(TOOL_SCHEMA)
+        self.response_cache = diskcache.Cache(cache_dir)
+        self.cache_ttl = cache_ttl
+        # Gradio session hash -> (expected history length, message buffer)
+        self._conversations: OrderedDict[str, tuple[int, list[BaseMessage]]] = OrderedDict()
+        self.max_sessions = max_sessions
+        # Part of every cache key so changing the model, options or tools invalidates old entries
+        self._cache_namespace = json.dumps(
+            [model, options, TOOL_SCHEMA], sort_keys=True, default=str
+        )
+
+        if warm_up:
+            threading.Thread(target=self._warm_up, daemon=True).start()
 
-    def run_agent(self, messages: list) -> str:
+    def _warm_up(self):
+        """
+        Load the model into Ollama in the background so the first user turn doesn't pay for it.
+        """
+        # num_ctx must match the chat model or Ollama reloads it on the first real request
+        warm_llm = ChatOllama(model=self.model, keep_alive=self.keep_alive,
+                              **{**self.options, "num_predict": 1})
+        try:
+            warm_llm.invoke([HumanMessage(content="hi")])
+            logger.debug("Model %s warmed up", self.model)
+        except Exception as e:
+            logger.warning("Model warm-up failed: %s", e)
+
+    def _cache_key(self, messages: list[BaseMessage]) -> str:
+        # Tool call ids are random per run, so only names and args go into the key
+        payload = [
+            (m.type, m.content, [(c["name"], c["args"]) for c in getattr(m, "tool_calls", None) or ()])
+            for m in messages
+        ]
+        serialized = json.dumps([self._cache_namespace, payload], sort_keys=True, default=str)
+        return blake2b(serialized.encode()).hexdigest()
+
+    async def _cached_invoke(self, messages: list[BaseMessage]) -> BaseMessage:
+        key = self._cache_key(messages)
+        cached = self.response_cache.get(key)
+        if cached is not None:
+            logger.debug("LLM response cache hit")
+            return messages_from_dict([cached])[0]
+
+        response = await self.llm.ainvoke(messages)
+        self.response_cache.set(key, message_to_dict(response), expire=self.cache_ttl)
+        return response
+
+    async def run_agent(self, messages: list) -> str:
         tool_updates = []
 
         for i in range(5):
-            response = self.llm.invoke(messages)
+            response = await self._cached_invoke(messages)
             messages.append(response)
 
-            print_debug(f"Iteration {i} Debug:", self.debug)
+            logger.debug("Iteration %d Debug:", i)
 
-            calls_to_execute, content_to_return = extract_tool_calls_and_content(response, debug=self.debug)
+            calls_to_execute, content_to_return = extract_tool_calls_and_content(response)
+            search_calls = [
+                (call["id"], call["args"].get("query", ""))
+                for call in calls_to_execute if call.get("name") == "search_web"
+            ]
 
-            if not calls_to_execute:
+            # search_web is the only bound tool, so a response without one is the final answer
+            if not search_calls:
+                content = content_to_return if content_to_return is not None else response.content
                 if tool_updates:
-                    return "\n".join(tool_updates) + "\n\n" + (content_to_return or "")
-                return content_to_return or ""
+                    return "\n".join(tool_updates) + "\n\n" + (content or "")
+                return content or ""
 
-            for call in calls_to_execute:
-                if call["name"] != "search_web":
-                    continue
-
-                query = call["args"].get("query", "")
+            for _, query in search_calls:
                 update_text = f"🔎 Searching the web for: \"{query}\""
                 tool_updates.append(update_text)
-                print_debug(update_text, self.debug)
-
-                result = search_web.func(query, debug=self.debug)
-                print_debug("Result: " + result[:500], self.debug)
+                logger.debug("%s", update_text)
+
+            # Independent searches from one response run concurrently
+            results = await asyncio.gather(
+                *(_search_web_impl(query) for _, query in search_calls),
+                return_exceptions=True,
+            )
+
+            for (call_id, _), result in zip(search_calls, results):
+                if isinstance(result, BaseException):
+                    result = f"Search failed: {result}"
+                logger.debug("Result: %.500s", result)
                 messages.append(
-                    ToolMessage(content=result, tool_call_id=call["id"])
+                    ToolMessage(content=result, tool_call_id=call_id)
                 )
 
         return "Max iterations reached"
 
-    def chat(self, message, history):
-        messages = []
+    def _conversation(self, session_id: str | None, history: list[dict]) -> list[BaseMessage]:
+        """
+        Return the running message buffer for a Gradio session, so each turn only appends
+        to it. Falls back to rebuilding from `history` when the two have drifted apart
+        (new session, clear, retry or undo). Always a copy, so a turn that fails
+        partway leaves the stored buffer untouched.
+        """
+        entry = self._conversations.get(session_id) if session_id else None
+        if entry is not None and entry[0] == len(history):
+            self._conversations.move_to_end(session_id)
+            return list(entry[1])
 
+        messages = []
         for m in history:
             cls = HumanMessage if m["role"] == "user" else AIMessage
             messages.append(cls(content=m["content"]))
+        return messages
+
+    async def chat(self, message, history, request: gr.Request = None):
+        session_id = request.session_hash if request else None
+        messages = self._conversation(session_id, history)
 
         messages.append(HumanMessage(content=message))
-        return self.run_agent(messages)
+        response = await self.run_agent(messages)
+
+        # Only reached if run_agent succeeded, so the stored buffer never holds half a turn
+        if session_id:
+            # Gradio adds this turn's user and assistant messages to history
+            self._conversations[session_id] = (len(history) + 2, messages)
+            self._conversations.move_to_end(session_id)
+            while len(self._conversations) > self.max_sessions:
+                self._conversations.popitem(last=False)
+        return response
 
     def build_interface(self):
         return gr.ChatInterface(
@@ -223,8 +537,12 @@ class ChatbotUI:
         )
 
 
-def main():
-    ChatbotUI(debug=True).build_interface().launch()
+def main(debug: bool = True):
+    if not logging.getLogger().hasHandlers():
+        logging.basicConfig(level=logging.WARNING)
+    # Only this module goes to DEBUG; httpx/gradio debug output is just noise here
+    logger.setLevel(logging.DEBUG if debug else logging.WARNING)
+    ChatbotUI().build_interface().launch()
 
 
 if __name__ == "__main__":
@@ -4,24 +4,38 @@ from langchain_core.tools import tool
 from langchain_core.prompts import ChatPromptTemplate
 from langgraph.prebuilt import create_react_agent
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
 
 # Initialize Ollama LLM
 llm = OllamaLLM(model="llama2")  # Change to your preferred model
 
 
+# Shared HTTP session so repeat searches reuse keep-alive connections
+session = requests.Session()
+adapter = HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+)
+session.mount('http://', adapter)
+session.mount('https://', adapter)
+session.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+})
+
+
 # Define web search function as a tool
 @tool
 def search_web(query: str) -> str:
     """Search the web for information. Use this when you need current information or facts."""
     try:
         # Using DuckDuckGo HTML search (no API key needed)
-        url = f"https://html.duckduckgo.com/html/?q={query}"
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
-        response = requests.get(url, headers=headers, timeout=10)
-        soup = BeautifulSoup(response.text, 'html.parser')
+        response = session.get(
+            "https://html.duckduckgo.com/html/", params={'q': query}, timeout=(3.05, 10)
+        )
+        soup = BeautifulSoup(response.text, 'lxml')
 
         # Extract search results
         results = []